@@ -10,17 +10,118 @@ This module provides a complete pipeline for:
 The design is modular to allow easy future upgrades (e.g., live microphone input).
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
 import os
+import random
+import shutil
+import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
-from openai import OpenAI
-from elevenlabs import VoiceSettings
-from elevenlabs.client import ElevenLabs
-from deep_translator import GoogleTranslator
-from pydub import AudioSegment
-from playsound3 import playsound
+# The API SDKs are imported where they are first used, so importing this
+# module (e.g. from a CLI that never runs the pipeline) stays cheap
+if TYPE_CHECKING:
+    from deep_translator import GoogleTranslator
+    from elevenlabs.client import AsyncElevenLabs
+    from openai import AsyncOpenAI
+
+# uvloop provides a faster event loop but does not support Windows. It is
+# passed to the loops this module creates rather than installed as the
+# global policy, so importing the module leaves the host application alone.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Cache keys only need to be collision-free for honest inputs, so prefer
+# BLAKE3 (SIMD and multithreaded, several times faster than SHA-256 on large
+# audio files). Both produce 64 hex characters, so cache layouts match.
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+
+# Read size used when hashing audio files for cache keys
+_HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Whisper rejects uploads over 25 MB; larger files are split below this size
+_WHISPER_MAX_MB = 24
+
+# ElevenLabs model used for speech synthesis (supports multiple languages)
+_TTS_MODEL_ID = "eleven_multilingual_v2"
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and 5xx
+_RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+def _is_retryable(status_code: Optional[int]) -> bool:
+    """Return True if a failed request with this status may succeed later."""
+    return status_code is not None and (
+        status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+    )
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: ~0.5s, 1s, 2s, ... capped at 10s."""
+    return min(0.5 * 2 ** attempt, 10.0) * random.uniform(0.75, 1.25)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a uvloop event loop, or asyncio's default if uvloop is missing."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _new_hasher():
+    """Return a BLAKE3 hasher, or SHA-256 if blake3 is not installed."""
+    if _blake3 is not None:
+        return _blake3(max_threads=_blake3.AUTO)
+    return hashlib.sha256()
+
+
+def _file_digest(file_path: str) -> str:
+    """Return the hex digest of a file, streamed in fixed-size blocks."""
+    hasher = _new_hasher()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _data_digest(data: bytes) -> str:
+    """Return the hex digest of an in-memory buffer."""
+    hasher = _new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def _text_digest(*parts: str) -> str:
+    """Return the hex digest of parts joined with '|'."""
+    return _data_digest("|".join(parts).encode("utf-8"))
+
+
+def _atomic_write(path: Path, data: bytes | bytearray) -> None:
+    """Write data to path so that readers never observe a partial file."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+
+def _touch(path: Path) -> None:
+    """Mark a cache file as just used for LRU eviction.
+    
+    Access times are bumped explicitly because many filesystems are mounted
+    with relatime/noatime.
+    """
+    os.utime(path, (time.time(), path.stat().st_mtime))
 
 
 class AudioTranslator:
@@ -28,27 +129,155 @@ class AudioTranslator:
     A modular class for audio translation and voice re-dubbing.
     
     This class handles the complete pipeline from audio input to synthesized
-    speech output in a different language.
+    speech output in a different language. Network-bound steps are coroutines
+    built on the async OpenAI and ElevenLabs clients, so several pipelines can
+    run concurrently on one event loop.
+    
+    Both clients share one HTTP/2 connection pool. Use the translator as an
+    async context manager (or call aclose()) to release it:
+    
+        async with AudioTranslator() as translator:
+            await translator.audio_translate_pipeline_async("sample.mp3")
+    
+    Synchronous callers release it, and the wrapper's event loop, with close().
     """
     
-    def __init__(self):
-        """Initialize the AudioTranslator with API clients."""
-        # Initialize OpenAI client for Whisper API
-        # The newest OpenAI model is "gpt-5" which was released August 7, 2025.
-        # do not change this unless explicitly requested by the user
-        self.openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    def __init__(
+        self,
+        cache_enabled: bool = True,
+        cache_max_bytes: int = 500 * 1024 * 1024,
+        openai_concurrency: int = 5,
+        elevenlabs_concurrency: int = 3,
+        translate_concurrency: int = 10,
+        max_retries: int = 4
+    ):
+        """
+        Initialize the AudioTranslator with API clients.
+        
+        Args:
+            cache_enabled: Reuse previous transcriptions, translations, speech
+                           and pipeline results for identical inputs instead
+                           of calling the APIs again
+            cache_max_bytes: Size cap for the on-disk cache; least recently
+                             used entries are evicted beyond it
+            openai_concurrency: Maximum Whisper requests in flight at once
+            elevenlabs_concurrency: Maximum speech syntheses in flight at once
+            translate_concurrency: Maximum Google Translate batches in flight
+            max_retries: Retries with exponential backoff for rate-limited
+                         (429) or failed (5xx) API calls
+        """
+        import httpx
         
-        # Initialize ElevenLabs client for text-to-speech
-        self.elevenlabs_client = ElevenLabs(api_key=os.environ.get("ELEVENLABS_API_KEY"))
+        # Shared HTTP/2 transport so both API clients reuse warm TLS connections
+        # across requests instead of handshaking for every call
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=240,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        
+        # API clients are created on first use (see the properties below), so
+        # a translator can be constructed before the API keys are configured
+        self._openai_client: Optional["AsyncOpenAI"] = None
+        self._elevenlabs_client: Optional["AsyncElevenLabs"] = None
+        
+        # Bound concurrent calls per provider so large asyncio.gather batches
+        # queue up locally instead of tripping API rate limits
+        self.max_retries = max_retries
+        self._openai_sem = asyncio.Semaphore(openai_concurrency)
+        self._eleven_sem = asyncio.Semaphore(elevenlabs_concurrency)
+        self._gtrans_sem = asyncio.Semaphore(translate_concurrency)
+        
+        # One GoogleTranslator per target language, reused across calls.
+        # Instances mutate their request parameters while translating, so
+        # each one is guarded by its own lock when used from worker threads.
+        self._translators: dict[str, "GoogleTranslator"] = {}
+        self._translator_locks: dict[str, threading.Lock] = {}
+        self._translators_lock = threading.Lock()
         
         # Create output directory for temporary audio files
         self.output_dir = Path("temp_audio")
         self.output_dir.mkdir(exist_ok=True)
+        
+        # Content-addressed caches: complete pipeline results, plus each step
+        # on its own so e.g. a new target language still reuses the transcript
+        self.cache_enabled = cache_enabled
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_dir = self.output_dir / "cache"
+        self.transcript_cache_dir = self.output_dir / "transcripts"
+        self.translation_cache_dir = self.output_dir / "translations"
+        self.speech_cache_dir = self.output_dir / "speech"
+        for cache_dir in self._cache_dirs():
+            cache_dir.mkdir(exist_ok=True)
+        
+        # Running total of cache bytes so writes only scan the cache
+        # directories once it is over the cap; None until the first scan
+        self._cache_bytes: Optional[int] = None
+        self._prune_lock = asyncio.Lock()
+        
+        # Event loop reused by the synchronous pipeline wrapper, created lazily
+        self._runner: Optional[asyncio.Runner] = None
+    
+    @property
+    def openai_client(self) -> "AsyncOpenAI":
+        """OpenAI client for the Whisper API, created on first use."""
+        if self._openai_client is None:
+            from openai import AsyncOpenAI
+            
+            # The newest OpenAI model is "gpt-5" which was released August 7, 2025.
+            # do not change this unless explicitly requested by the user
+            self._openai_client = AsyncOpenAI(
+                api_key=os.environ.get("OPENAI_API_KEY"),
+                http_client=self._http,
+                max_retries=self.max_retries  # the SDK backs off on 429/5xx itself
+            )
+        return self._openai_client
     
-    def transcribe_audio(self, audio_file_path: str) -> str:
+    @property
+    def elevenlabs_client(self) -> "AsyncElevenLabs":
+        """ElevenLabs client for text-to-speech, created on first use."""
+        if self._elevenlabs_client is None:
+            from elevenlabs.client import AsyncElevenLabs
+            
+            self._elevenlabs_client = AsyncElevenLabs(
+                api_key=os.environ.get("ELEVENLABS_API_KEY"),
+                httpx_client=self._http
+            )
+        return self._elevenlabs_client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self._http.aclose()
+    
+    def close(self) -> None:
+        """
+        Close the connection pool and the synchronous wrapper's event loop.
+        
+        For callers of audio_translate_pipeline(); async code should use
+        aclose() instead. Must not be called from inside a running event loop.
+        """
+        runner = self._runner or asyncio.Runner(loop_factory=new_event_loop)
+        self._runner = None
+        try:
+            runner.run(self.aclose())
+        finally:
+            runner.close()
+    
+    async def __aenter__(self) -> "AudioTranslator":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def transcribe_audio(self, audio_file_path: str) -> str:
         """
         Step 1: Transcribe audio file to text using OpenAI Whisper API.
         
+        Files within Whisper's upload limit are read from disk once; the same
+        buffer is hashed for the transcript cache and uploaded. Larger files
+        are hashed by streaming, split into segments with ffmpeg, and the
+        segments transcribed concurrently with their texts joined.
+        
         Args:
             audio_file_path: Path to the audio file (WAV, MP3, etc.)
         
@@ -61,31 +290,224 @@ class AudioTranslator:
         """
         print(f"\n[Step 1/4] Transcribing audio file: {audio_file_path}")
         
+        audio_data, audio_digest = await self._load_audio(audio_file_path)
+        return await self._transcribe_loaded(audio_file_path, audio_data, audio_digest)
+    
+    async def _load_audio(self, audio_file_path: str) -> tuple[Optional[bytes], Optional[str]]:
+        """
+        Read and hash an audio file once for transcription and cache lookups.
+        
+        Returns:
+            The file contents if it fits in one Whisper upload (None for larger
+            files, which are streamed), and its content digest if caching is
+            enabled (else None)
+        
+        Raises:
+            FileNotFoundError: If the audio file doesn't exist
+        """
         # Validate file exists
         if not os.path.exists(audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
         
+        # Small files are read once and shared by the cache probe and upload;
+        # larger ones are streamed so memory use stays bounded
+        audio_data = None
+        if os.path.getsize(audio_file_path) <= _WHISPER_MAX_MB * 1024 * 1024:
+            audio_data = await asyncio.to_thread(Path(audio_file_path).read_bytes)
+        
+        audio_digest = None
+        if self.cache_enabled:
+            if audio_data is not None:
+                audio_digest = await asyncio.to_thread(_data_digest, audio_data)
+            else:
+                audio_digest = await asyncio.to_thread(_file_digest, audio_file_path)
+        
+        return audio_data, audio_digest
+    
+    async def _transcribe_loaded(
+        self,
+        audio_file_path: str,
+        audio_data: Optional[bytes],
+        audio_digest: Optional[str]
+    ) -> str:
+        """
+        Transcribe audio already read and hashed by _load_audio().
+        
+        audio_data is uploaded under the name of audio_file_path; when it is
+        None the file is split and streamed instead.
+        """
+        # Transcripts depend only on the audio bytes, not on language or voice
+        if audio_digest is not None:
+            transcribed_text = self._load_transcript(audio_digest)
+            if transcribed_text is not None:
+                return transcribed_text
+        
         try:
-            # Open the audio file and send to Whisper API
-            with open(audio_file_path, "rb") as audio_file:
-                response = self.openai_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file
+            if audio_data is not None:
+                transcribed_text = await self._transcribe(
+                    (Path(audio_file_path).name, audio_data)
                 )
-            
-            transcribed_text = response.text
-            print(f"✓ Transcription successful!")
-            print(f"  Original text: {transcribed_text}")
-            
-            return transcribed_text
+            else:
+                transcribed_text = await self._transcribe_segments(audio_file_path)
         
         except Exception as e:
             raise Exception(f"Failed to transcribe audio: {str(e)}")
+        
+        print(f"✓ Transcription successful!")
+        print(f"  Original text: {transcribed_text}")
+        
+        if audio_digest is not None:
+            await self._store_transcript(audio_digest, transcribed_text)
+        
+        return transcribed_text
+    
+    async def transcribe_audio_bytes(
+        self,
+        audio_data: bytes,
+        audio_format: str = "mp3"
+    ) -> str:
+        """
+        Step 1 (in memory): Transcribe raw audio bytes using OpenAI Whisper API.
+        
+        For audio that is already in memory (e.g. received over the network or
+        produced by an earlier stage), so it can be uploaded directly instead
+        of being written to a temporary file for transcribe_audio().
+        
+        Args:
+            audio_data: Encoded audio, at most 24 MB
+            audio_format: File extension of the encoding (e.g. 'mp3', 'wav',
+                          'webm'); Whisper uses it to detect the format
+        
+        Returns:
+            Transcribed text from the audio
+        
+        Raises:
+            ValueError: If the audio exceeds Whisper's upload limit
+            Exception: If transcription fails
+        """
+        print(f"\n[Step 1/4] Transcribing {len(audio_data)} bytes of {audio_format} audio")
+        
+        if len(audio_data) > _WHISPER_MAX_MB * 1024 * 1024:
+            raise ValueError(
+                f"In-memory audio is limited to {_WHISPER_MAX_MB} MB; save longer "
+                f"recordings to a file and use transcribe_audio() to split them"
+            )
+        
+        audio_digest = None
+        if self.cache_enabled:
+            audio_digest = await asyncio.to_thread(_data_digest, audio_data)
+        
+        # The name only carries the extension Whisper uses to detect the format
+        return await self._transcribe_loaded(
+            f"audio.{audio_format.lstrip('.')}", audio_data, audio_digest
+        )
+    
+    def _load_transcript(self, audio_digest: str) -> Optional[str]:
+        """Return the cached transcript for audio_digest, or None on a miss."""
+        transcript_path = self.transcript_cache_dir / f"{audio_digest}.txt"
+        if not transcript_path.exists():
+            return None
+        
+        _touch(transcript_path)
+        transcribed_text = transcript_path.read_text(encoding="utf-8")
+        print(f"✓ Transcription loaded from cache!")
+        print(f"  Original text: {transcribed_text}")
+        return transcribed_text
+    
+    async def _store_transcript(self, audio_digest: str, transcribed_text: str) -> None:
+        """Cache a fresh transcript under audio_digest."""
+        data = transcribed_text.encode("utf-8")
+        _atomic_write(self.transcript_cache_dir / f"{audio_digest}.txt", data)
+        await self._cache_written(len(data))
+    
+    async def _transcribe(self, audio_file) -> str:
+        """
+        Send one upload within Whisper's size limit to the API.
+        
+        audio_file is anything the OpenAI SDK accepts as a file: an open
+        binary file or a (filename, bytes) tuple. The filename extension
+        tells Whisper the audio format.
+        """
+        async with self._openai_sem:
+            response = await self.openai_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file
+            )
+        return response.text
+    
+    async def _transcribe_segment(self, segment_path: Path) -> str:
+        """Transcribe one segment produced by _split_audio()."""
+        # Pass the open file so only segments being uploaded are in memory
+        with open(segment_path, "rb") as segment_file:
+            return await self._transcribe(segment_file)
+    
+    async def _transcribe_segments(self, audio_file_path: str) -> str:
+        """Split an oversized file, transcribe the segments concurrently and join them."""
+        segments = await asyncio.to_thread(self._split_audio, audio_file_path)
+        print(f"  Split into {len(segments)} segments for transcription")
+        
+        try:
+            texts = await asyncio.gather(
+                *(self._transcribe_segment(segment) for segment in segments)
+            )
+        finally:
+            shutil.rmtree(segments[0].parent, ignore_errors=True)
+        
+        return " ".join(text.strip() for text in texts)
+    
+    def _split_audio(self, audio_file_path: str, max_mb: int = _WHISPER_MAX_MB) -> list[Path]:
+        """
+        Split an audio file into MP3 segments smaller than max_mb.
+        
+        ffmpeg streams the input, so memory use stays bounded regardless of
+        file size. Segments are re-encoded as 16 kHz mono at 64 kbps (Whisper
+        downsamples to 16 kHz mono anyway), and their duration is chosen so
+        each one stays under max_mb with some headroom.
+        
+        Returns:
+            Segment paths in playback order, inside a fresh temporary
+            directory under output_dir that the caller should remove
+        """
+        bitrate_kbps = 64
+        segment_seconds = int(max_mb * 1024 * 1024 * 8 / (bitrate_kbps * 1000) * 0.9)
+        segment_dir = Path(tempfile.mkdtemp(prefix="segments_", dir=self.output_dir))
+        
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg", "-hide_banner", "-loglevel", "error",
+                    "-i", audio_file_path,
+                    "-vn", "-ac", "1", "-ar", "16000", "-b:a", f"{bitrate_kbps}k",
+                    "-f", "segment", "-segment_time", str(segment_seconds),
+                    "-reset_timestamps", "1",
+                    str(segment_dir / "segment_%04d.mp3")
+                ],
+                check=True,
+                capture_output=True
+            )
+        except FileNotFoundError:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+            raise Exception(
+                f"ffmpeg is required to split audio files larger than {max_mb} MB"
+            )
+        except subprocess.CalledProcessError as e:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+            raise Exception(f"ffmpeg could not split the audio: {e.stderr.decode(errors='replace')}")
+        
+        segments = sorted(segment_dir.glob("segment_*.mp3"))
+        if not segments:
+            shutil.rmtree(segment_dir, ignore_errors=True)
+            raise Exception("ffmpeg produced no audio segments")
+        
+        return segments
     
-    def translate_text(self, text: str, target_language: str = "es") -> str:
+    async def translate_text(self, text: str, target_language: str = "es") -> str:
         """
         Step 2: Translate text to target language using Google Translate.
         
+        deep-translator is synchronous, so the request runs on a worker thread
+        and concurrent pipelines keep making progress meanwhile.
+        
         Args:
             text: Text to translate
             target_language: Target language code (e.g., 'es' for Spanish, 'fr' for French)
@@ -99,20 +521,120 @@ class AudioTranslator:
         """
         print(f"\n[Step 2/4] Translating text to '{target_language}'")
         
+        translation_path = None
+        if self.cache_enabled:
+            translation_path = self._translation_cache_path(text, target_language)
+            if translation_path.exists():
+                _touch(translation_path)
+                translated_text = translation_path.read_text(encoding="utf-8")
+                print(f"✓ Translation loaded from cache!")
+                print(f"  Translated text: {translated_text}")
+                return translated_text
+        
         try:
             # Use deep-translator's GoogleTranslator for free translation
-            translator = GoogleTranslator(source='auto', target=target_language)
-            translated_text = translator.translate(text)
+            async with self._gtrans_sem:
+                translated_text = (await asyncio.to_thread(
+                    self._translate_batch, [text], target_language
+                ))[0]
             
             print(f"✓ Translation successful!")
             print(f"  Translated text: {translated_text}")
             
+            if translation_path is not None:
+                data = translated_text.encode("utf-8")
+                _atomic_write(translation_path, data)
+                await self._cache_written(len(data))
+            
             return translated_text
         
         except Exception as e:
             raise Exception(f"Failed to translate text: {str(e)}")
     
-    def text_to_speech(
+    async def translate_texts(
+        self,
+        texts: list[str],
+        target_language: str = "es"
+    ) -> list[str]:
+        """
+        Step 2 (batch): Translate several texts to one target language.
+        
+        Runs on a worker thread so the event loop keeps serving other
+        pipelines while Google Translate responds. Cached translations are
+        reused and only the remaining texts are sent.
+        
+        Args:
+            texts: Texts to translate
+            target_language: Target language code (see translate_text())
+        
+        Returns:
+            Translated texts, in the same order as texts
+        
+        Raises:
+            Exception: If translation fails
+        """
+        print(f"\n[Step 2/4] Translating {len(texts)} texts to '{target_language}'")
+        
+        translated: list[Optional[str]] = [None] * len(texts)
+        if self.cache_enabled:
+            for i, text in enumerate(texts):
+                translation_path = self._translation_cache_path(text, target_language)
+                if translation_path.exists():
+                    _touch(translation_path)
+                    translated[i] = translation_path.read_text(encoding="utf-8")
+        
+        pending = [i for i, result in enumerate(translated) if result is None]
+        if pending:
+            try:
+                async with self._gtrans_sem:
+                    results = await asyncio.to_thread(
+                        self._translate_batch,
+                        [texts[i] for i in pending],
+                        target_language
+                    )
+            except Exception as e:
+                raise Exception(f"Failed to translate text: {str(e)}")
+            
+            written = 0
+            for i, result in zip(pending, results):
+                translated[i] = result
+                if self.cache_enabled:
+                    data = result.encode("utf-8")
+                    _atomic_write(
+                        self._translation_cache_path(texts[i], target_language),
+                        data
+                    )
+                    written += len(data)
+            if self.cache_enabled:
+                await self._cache_written(written)
+        
+        print(f"✓ Translation successful! ({len(texts) - len(pending)} from cache)")
+        
+        return translated
+    
+    def _get_translator(self, target_language: str) -> "GoogleTranslator":
+        """Return the shared GoogleTranslator for target_language, creating it once."""
+        from deep_translator import GoogleTranslator
+        
+        with self._translators_lock:
+            translator = self._translators.get(target_language)
+            if translator is None:
+                translator = GoogleTranslator(source='auto', target=target_language)
+                self._translators[target_language] = translator
+                self._translator_locks[target_language] = threading.Lock()
+            return translator
+    
+    def _translate_batch(self, texts: list[str], target_language: str) -> list[str]:
+        """Translate texts with the shared translator (blocking, thread-safe)."""
+        translator = self._get_translator(target_language)
+        with self._translator_locks[target_language]:
+            return translator.translate_batch(texts)
+    
+    def _translation_cache_path(self, text: str, target_language: str) -> Path:
+        """Return the translation cache file for text and target_language."""
+        return self.translation_cache_dir / f"{_text_digest(text, target_language)}.txt"
+    
+    async def text_to_speech(
         self, 
         text: str, 
         voice_id: str = "21m00Tcm4TlvDq8ikWAM",  # Default: Rachel (ElevenLabs)
@@ -140,43 +662,308 @@ class AudioTranslator:
         """
         print(f"\n[Step 3/4] Converting text to speech with voice: {voice_id}")
         
+        output_path = self.output_dir / output_filename
+        
+        speech_path = None
+        if self.cache_enabled:
+            speech_path = self._speech_cache_path(text, voice_id, 0)
+            if speech_path.exists():
+                _touch(speech_path)
+                shutil.copyfile(speech_path, output_path)
+                print(f"✓ Speech loaded from cache!")
+                print(f"  Audio saved to: {output_path}")
+                return str(output_path)
+        
         try:
-            # Generate speech using ElevenLabs API
-            response = self.elevenlabs_client.text_to_speech.convert(
-                voice_id=voice_id,
-                optimize_streaming_latency=0,
-                output_format="mp3_44100_128",
-                text=text,
-                model_id="eleven_multilingual_v2",  # Supports multiple languages
-                voice_settings=VoiceSettings(
-                    stability=0.5,
-                    similarity_boost=0.75,
-                    style=0.0,
-                    use_speaker_boost=True,
-                )
-            )
-            
-            # Save the audio to a file
-            output_path = self.output_dir / output_filename
-            
-            # Write the audio stream to file
-            with open(output_path, "wb") as f:
-                for chunk in response:
-                    if chunk:
-                        f.write(chunk)
+            # Generate speech using ElevenLabs API; collect the stream in memory
+            # and write it with one call instead of one small write per chunk
+            audio = bytearray()
+            async for chunk in self._speech_chunks(text, voice_id):
+                audio.extend(chunk)
+            output_path.write_bytes(audio)
             
             print(f"✓ Text-to-speech conversion successful!")
             print(f"  Audio saved to: {output_path}")
             
+            if speech_path is not None:
+                _atomic_write(speech_path, audio)
+                await self._cache_written(len(audio))
+            
             return str(output_path)
         
         except Exception as e:
             raise Exception(f"Failed to convert text to speech: {str(e)}")
     
-    def play_audio(self, audio_file_path: str) -> None:
+    async def text_to_speech_stream(
+        self,
+        text: str,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM"
+    ) -> AsyncIterator[bytes]:
+        """
+        Step 3 (streaming): Yield synthesized speech chunks as they arrive.
+        
+        Uses ElevenLabs' maximum streaming latency optimization so the first
+        chunk arrives as early as possible. Nothing is written to disk.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs voice ID (see text_to_speech())
+        
+        Yields:
+            MP3 audio chunks
+        """
+        async for chunk in self._speech_chunks(text, voice_id, optimize_streaming_latency=3):
+            yield chunk
+    
+    def _speech_cache_path(
+        self,
+        text: str,
+        voice_id: str,
+        optimize_streaming_latency: int
+    ) -> Path:
+        """Return the speech cache file for text, voice, model and latency mode."""
+        key = _text_digest(text, voice_id, _TTS_MODEL_ID, str(optimize_streaming_latency))
+        return self.speech_cache_dir / f"{key}.mp3"
+    
+    async def _speech_chunks(
+        self,
+        text: str,
+        voice_id: str,
+        optimize_streaming_latency: int = 0
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield synthesized audio chunks from ElevenLabs.
+        
+        Holds the ElevenLabs semaphore for the whole stream and retries
+        rate-limited or failed requests with exponential backoff. The SDK's
+        streaming endpoint does not retry on its own.
+        """
+        from elevenlabs import VoiceSettings
+        from elevenlabs.core.api_error import ApiError
+        
+        async with self._eleven_sem:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = self.elevenlabs_client.text_to_speech.convert(
+                        voice_id=voice_id,
+                        optimize_streaming_latency=optimize_streaming_latency,
+                        output_format="mp3_44100_128",
+                        text=text,
+                        model_id=_TTS_MODEL_ID,
+                        voice_settings=VoiceSettings(
+                            stability=0.5,
+                            similarity_boost=0.75,
+                            style=0.0,
+                            use_speaker_boost=True,
+                        )
+                    )
+                    async for chunk in response:
+                        if chunk:
+                            yield chunk
+                    return
+                
+                except ApiError as e:
+                    # Status errors are raised before the first chunk, so a
+                    # retry never duplicates audio already yielded
+                    if attempt == self.max_retries or not _is_retryable(e.status_code):
+                        raise
+                    print(f"  ElevenLabs returned {e.status_code}, retrying...")
+                    await asyncio.sleep(_backoff_delay(attempt))
+    
+    async def translate_and_speak(
+        self,
+        original_text: str,
+        target_lang: str = "es",
+        voice: str = "21m00Tcm4TlvDq8ikWAM",
+        output_filename: Optional[str] = None,
+        play_audio: bool = False
+    ) -> dict:
+        """
+        Steps 2-4: Translate already-transcribed text, synthesize and play it.
+        
+        Transcription depends only on the input audio, so when the same file
+        is dubbed into several languages it can be transcribed once with
+        transcribe_audio() and the text fanned out to this method.
+        
+        Args:
+            original_text: Transcribed text to translate
+            target_lang: Target language code (e.g., 'es', 'fr', 'de')
+            voice: ElevenLabs voice ID for speech synthesis
+            output_filename: Name for the output audio file
+                             (default: "translated_<target_lang>.mp3")
+            play_audio: Whether to play the speech. When ffplay is available
+                        playback starts with the first streamed chunk.
+        
+        Returns:
+            Dictionary with original_text, translated_text, and
+            output_audio_path (None if the speech was streamed to the player
+            with caching disabled, since nothing is written to disk then)
+        """
+        output_filename = output_filename or f"translated_{target_lang}.mp3"
+        
+        # Step 2: Translate the text to target language
+        translated_text = await self.translate_text(original_text, target_lang)
+        
+        if play_audio and shutil.which("ffplay"):
+            # Steps 3-4 fused: play the speech while it is being synthesized
+            output_audio_path = await self.text_to_speech_and_play(
+                text=translated_text,
+                voice_id=voice,
+                output_filename=output_filename
+            )
+        else:
+            # Step 3: Convert translated text to speech
+            output_audio_path = await self.text_to_speech(
+                text=translated_text,
+                voice_id=voice,
+                output_filename=output_filename
+            )
+            
+            # Step 4: Play the audio (optional)
+            if play_audio:
+                await self.play_audio(output_audio_path)
+        
+        return {
+            "original_text": original_text,
+            "translated_text": translated_text,
+            "output_audio_path": output_audio_path
+        }
+    
+    async def text_to_speech_and_play(
+        self,
+        text: str,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM",
+        output_filename: str = "output.mp3"
+    ) -> Optional[str]:
+        """
+        Steps 3-4 fused: Stream synthesized speech straight into the player.
+        
+        Playback starts as soon as the first chunk arrives instead of after
+        the whole file has been written. With caching enabled the chunks are
+        also collected and saved to output_filename (and the speech cache);
+        an asyncio.Queue decouples the download from real-time playback so
+        the file is complete as soon as the download is.
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: ElevenLabs voice ID (see text_to_speech())
+            output_filename: Name for the output audio file
+        
+        Returns:
+            Path to the saved audio file, or None if caching is disabled
+        
+        Raises:
+            Exception: If text-to-speech conversion fails
+        """
+        print(f"\n[Step 3/4] Streaming speech to the player with voice: {voice_id}")
+        
+        output_path = self.output_dir / output_filename
+        
+        speech_path = None
+        if self.cache_enabled:
+            speech_path = self._speech_cache_path(text, voice_id, 3)
+            if speech_path.exists():
+                _touch(speech_path)
+                shutil.copyfile(speech_path, output_path)
+                print(f"✓ Speech loaded from cache!")
+                await self.play_audio(str(output_path))
+                return str(output_path)
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        audio = bytearray() if speech_path is not None else None
+        
+        async def produce() -> None:
+            try:
+                async for chunk in self.text_to_speech_stream(text, voice_id):
+                    queue.put_nowait(chunk)
+                    if audio is not None:
+                        audio.extend(chunk)
+                
+                # Save as soon as the download ends; the player may still be
+                # working through the queue in real time
+                if audio is not None:
+                    output_path.write_bytes(audio)
+                    _atomic_write(speech_path, audio)
+                    await self._cache_written(len(audio))
+                    print(f"  Audio saved to: {output_path}")
+            finally:
+                queue.put_nowait(None)
+        
+        async def queued_chunks() -> AsyncIterator[bytes]:
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+        
+        playback = asyncio.create_task(self.play_stream(queued_chunks()))
+        try:
+            await produce()
+        except Exception as e:
+            raise Exception(f"Failed to convert text to speech: {str(e)}")
+        finally:
+            # The sentinel lets playback finish; wait for it either way
+            outcome = (await asyncio.gather(playback, return_exceptions=True))[0]
+        
+        # Playback problems don't invalidate the speech that was saved
+        if isinstance(outcome, Exception):
+            print(f"⚠ Could not play audio automatically: {str(outcome)}")
+            if audio is not None:
+                print(f"  You can manually play the file at: {output_path}")
+        
+        return str(output_path) if audio is not None else None
+    
+    async def play_stream(self, chunks: AsyncIterator[bytes]) -> None:
+        """
+        Step 4 (streaming): Play audio chunks as they arrive by piping them
+        into ffplay.
+        
+        Args:
+            chunks: Async iterator of encoded audio chunks (e.g. MP3)
+        """
+        print(f"\n[Step 4/4] Playing audio stream")
+        
+        try:
+            player = await asyncio.create_subprocess_exec(
+                "ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "-",
+                stdin=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            print(f"⚠ Could not play audio automatically: {str(e)}")
+            async for _ in chunks:
+                pass
+            return
+        
+        try:
+            async for chunk in chunks:
+                player.stdin.write(chunk)
+                await player.stdin.drain()
+        
+        except (BrokenPipeError, ConnectionResetError):
+            # The player was closed early; let the stream finish regardless
+            print(f"⚠ Audio player exited before playback finished")
+            async for _ in chunks:
+                pass
+            return
+        
+        except BaseException:
+            # The stream failed or was cancelled; stop playing what arrived
+            player.kill()
+            raise
+        
+        finally:
+            # Always reap the player so it doesn't linger as a zombie
+            player.stdin.close()
+            returncode = await player.wait()
+        
+        if returncode == 0:
+            print(f"✓ Audio playback complete!")
+        else:
+            print(f"⚠ Could not play audio automatically: ffplay exited with status {returncode}")
+    
+    async def play_audio(self, audio_file_path: str) -> None:
         """
         Step 4: Play the audio file locally.
         
+        playsound blocks until playback ends, so it runs on a worker thread.
+        
         Args:
             audio_file_path: Path to the audio file to play
         
@@ -186,20 +973,23 @@ class AudioTranslator:
         print(f"\n[Step 4/4] Playing audio file: {audio_file_path}")
         
         try:
+            from playsound3 import playsound
+            
             # Play the audio file
-            playsound(audio_file_path)
+            await asyncio.to_thread(playsound, audio_file_path)
             print(f"✓ Audio playback complete!")
         
         except Exception as e:
             print(f"⚠ Could not play audio automatically: {str(e)}")
             print(f"  You can manually play the file at: {audio_file_path}")
     
-    def audio_translate_pipeline(
+    async def audio_translate_pipeline_async(
         self,
         file_path: str,
         target_lang: str = "es",
         voice: str = "21m00Tcm4TlvDq8ikWAM",
-        play_audio: bool = True
+        play_audio: bool = True,
+        output_filename: Optional[str] = None
     ) -> dict:
         """
         Complete pipeline: Audio → Transcription → Translation → Speech → Play
@@ -211,16 +1001,21 @@ class AudioTranslator:
             target_lang: Target language code (e.g., 'es', 'fr', 'de')
             voice: ElevenLabs voice ID for speech synthesis
             play_audio: Whether to play the audio after generation
+            output_filename: Name for the output audio file
+                             (default: "translated_<target_lang>.mp3"). Give
+                             concurrent runs distinct names so they don't
+                             overwrite each other.
         
         Returns:
             Dictionary containing:
                 - original_text: Transcribed text from input audio
                 - translated_text: Text translated to target language
-                - output_audio_path: Path to generated audio file
+                - output_audio_path: Path to generated audio file (None if
+                  it was only streamed to the player with caching disabled)
         
         Example:
             translator = AudioTranslator()
-            result = translator.audio_translate_pipeline(
+            result = await translator.audio_translate_pipeline_async(
                 file_path="sample.mp3",
                 target_lang="es",
                 voice="21m00Tcm4TlvDq8ikWAM"
@@ -233,37 +1028,204 @@ class AudioTranslator:
         print("=" * 70)
         
         try:
-            # Step 1: Transcribe the audio to text
-            original_text = self.transcribe_audio(file_path)
+            result = None
             
-            # Step 2: Translate the text to target language
-            translated_text = self.translate_text(original_text, target_lang)
+            # Read and hash the audio once; the digest keys both the pipeline
+            # cache and the transcript cache, and the buffer is uploaded as is
+            audio_data, audio_digest = await self._load_audio(file_path)
             
-            # Step 3: Convert translated text to speech
-            output_audio_path = self.text_to_speech(
-                text=translated_text,
-                voice_id=voice,
-                output_filename=f"translated_{target_lang}.mp3"
-            )
+            # Look for a previous run on the same audio, language and voice
+            if audio_digest is not None:
+                cache_key = self._cache_key(audio_digest, target_lang, voice)
+                result = self._load_cached_result(cache_key)
             
-            # Step 4: Play the audio (optional)
-            if play_audio:
-                self.play_audio(output_audio_path)
+            if result is not None:
+                print(f"\n✓ Cache hit! Reusing previous result for: {file_path}")
+                
+                # Copy the audio out of the cache, where eviction may remove
+                # it, to the file this run was asked to produce
+                output_path = self.output_dir / (
+                    output_filename or f"translated_{target_lang}.mp3"
+                )
+                shutil.copyfile(result["output_audio_path"], output_path)
+                result["output_audio_path"] = str(output_path)
+                print(f"  Audio saved to: {output_path}")
+                
+                # Step 4: Play the cached audio (optional)
+                if play_audio:
+                    await self.play_audio(result["output_audio_path"])
+            else:
+                # Step 1: Transcribe the audio to text
+                print(f"\n[Step 1/4] Transcribing audio file: {file_path}")
+                original_text = await self._transcribe_loaded(
+                    file_path, audio_data, audio_digest
+                )
+                
+                # Steps 2-4: Translate, convert to speech and play (optional)
+                result = await self.translate_and_speak(
+                    original_text=original_text,
+                    target_lang=target_lang,
+                    voice=voice,
+                    output_filename=output_filename,
+                    play_audio=play_audio
+                )
+                
+                if audio_digest is not None:
+                    await self._store_cached_result(cache_key, result, voice)
             
             print("\n" + "=" * 70)
             print("PIPELINE COMPLETED SUCCESSFULLY!")
             print("=" * 70)
             
-            # Return results
-            return {
-                "original_text": original_text,
-                "translated_text": translated_text,
-                "output_audio_path": output_audio_path
-            }
+            return result
         
         except Exception as e:
             print(f"\n✗ Pipeline failed: {str(e)}")
             raise
+    
+    def _cache_key(self, audio_digest: str, target_lang: str, voice: str) -> str:
+        """
+        Build the pipeline cache key for an audio digest, language and voice.
+        
+        The audio is keyed by content, so renamed or copied files still hit
+        the cache while edited files miss it.
+        """
+        return _text_digest(audio_digest, target_lang, voice)
+    
+    def _load_cached_result(self, cache_key: str) -> Optional[dict]:
+        """Return the cached pipeline result for cache_key, or None on a miss."""
+        manifest_path = self.cache_dir / f"{cache_key}.json"
+        if not manifest_path.exists():
+            return None
+        
+        try:
+            result = json.loads(manifest_path.read_text(encoding="utf-8"))
+            speech_path = self.speech_cache_dir / result.pop("speech_file")
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        # The speech cache entry may have been evicted independently
+        if not speech_path.exists():
+            return None
+        
+        _touch(manifest_path)
+        _touch(speech_path)
+        
+        result["output_audio_path"] = str(speech_path)
+        return result
+    
+    async def _store_cached_result(self, cache_key: str, result: dict, voice: str) -> None:
+        """
+        Record a fresh pipeline result in the cache.
+        
+        The manifest refers to the speech cache entry for the translated text
+        instead of keeping a second copy of the audio. Either latency mode's
+        rendition will do; if neither is cached there is nothing to point at.
+        """
+        candidates = (
+            self._speech_cache_path(result["translated_text"], voice, latency)
+            for latency in (0, 3)
+        )
+        speech_path = next((path for path in candidates if path.exists()), None)
+        if speech_path is None:
+            return
+        
+        manifest = {
+            "original_text": result["original_text"],
+            "translated_text": result["translated_text"],
+            "speech_file": speech_path.name,
+        }
+        data = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+        _atomic_write(self.cache_dir / f"{cache_key}.json", data)
+        await self._cache_written(len(data))
+    
+    def _cache_dirs(self) -> tuple:
+        """Return every directory whose contents count toward cache_max_bytes."""
+        return (
+            self.cache_dir,
+            self.transcript_cache_dir,
+            self.translation_cache_dir,
+            self.speech_cache_dir,
+        )
+    
+    async def _cache_written(self, size: int) -> None:
+        """
+        Account for size bytes just written to the cache, pruning if needed.
+        
+        The directories are only scanned (on a worker thread) for the first
+        write and whenever the running total exceeds cache_max_bytes, so most
+        writes cost no filesystem calls beyond the write itself.
+        """
+        if self._cache_bytes is not None:
+            self._cache_bytes += size
+            if self._cache_bytes <= self.cache_max_bytes:
+                return
+        
+        async with self._prune_lock:
+            # Another write may have pruned while this one waited
+            if self._cache_bytes is None or self._cache_bytes > self.cache_max_bytes:
+                self._cache_bytes = await asyncio.to_thread(self._prune_cache)
+    
+    def _prune_cache(self) -> int:
+        """
+        Evict least recently used cache files until under cache_max_bytes.
+        
+        Returns:
+            Total size of the files left in the cache
+        """
+        entries = []
+        for cache_dir in self._cache_dirs():
+            for path in cache_dir.iterdir():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.cache_max_bytes:
+                break
+            total_size -= size
+            path.unlink(missing_ok=True)
+        
+        return total_size
+    
+    def audio_translate_pipeline(
+        self,
+        file_path: str,
+        target_lang: str = "es",
+        voice: str = "21m00Tcm4TlvDq8ikWAM",
+        play_audio: bool = True
+    ) -> dict:
+        """
+        Synchronous wrapper around audio_translate_pipeline_async().
+        
+        Runs the pipeline to completion on an event loop owned by this
+        translator, so repeated calls keep reusing the same client connections.
+        Must not be called from inside a running event loop; await
+        audio_translate_pipeline_async() there instead.
+        
+        Args:
+            file_path: Path to the input audio file (WAV, MP3, etc.)
+            target_lang: Target language code (e.g., 'es', 'fr', 'de')
+            voice: ElevenLabs voice ID for speech synthesis
+            play_audio: Whether to play the audio after generation
+        
+        Returns:
+            Dictionary with original_text, translated_text, and output_audio_path
+        """
+        if self._runner is None:
+            self._runner = asyncio.Runner(loop_factory=new_event_loop)
+        return self._runner.run(
+            self.audio_translate_pipeline_async(file_path, target_lang, voice, play_audio)
+        )
+
+
+# Translator shared by audio_translate_pipeline() so its connection pool and
+# translator instances persist across calls; created on first use and closed
+# when the interpreter exits
+_default_translator: Optional[AudioTranslator] = None
 
 
 # Convenience function for quick usage
@@ -275,6 +1237,10 @@ def audio_translate_pipeline(
     """
     Quick access function for the audio translation pipeline.
     
+    All calls share one module-level AudioTranslator, so repeated calls reuse
+    its warm HTTP connections. Must not be called from inside a running
+    event loop.
+    
     Args:
         file_path: Path to the input audio file
         target_lang: Target language code (default: 'es' for Spanish)
@@ -286,8 +1252,11 @@ def audio_translate_pipeline(
     Example:
         result = audio_translate_pipeline("my_audio.mp3", "fr", "21m00Tcm4TlvDq8ikWAM")
     """
-    translator = AudioTranslator()
-    return translator.audio_translate_pipeline(file_path, target_lang, voice)
+    global _default_translator
+    if _default_translator is None:
+        _default_translator = AudioTranslator()
+        atexit.register(_default_translator.close)
+    return _default_translator.audio_translate_pipeline(file_path, target_lang, voice)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,20 @@ Example Usage Script for Audio Translation & Re-Dubbing App
 
 This script demonstrates how to use the audio translation pipeline
 with different languages and voices.
+
+All examples share one AudioTranslator and run on one event loop, so HTTP
+connections, translator instances and caches are reused between them.
 """
 
-from audio_translator import audio_translate_pipeline, AudioTranslator
+import asyncio
+
+from audio_translator import AudioTranslator, new_event_loop
+
 
+translator = AudioTranslator()
 
-def example_basic_usage():
+
+async def example_basic_usage():
     """
     Basic example: Translate an audio file to Spanish
     """
@@ -16,8 +24,8 @@ def example_basic_usage():
     print("EXAMPLE 1: Basic Usage - English to Spanish")
     print("=" * 70)
     
-    # Simple one-line usage
-    result = audio_translate_pipeline(
+    # Simple one-call usage
+    result = await translator.audio_translate_pipeline_async(
         file_path="sample_audio.mp3",  # Replace with your audio file
         target_lang="es",               # Spanish
         voice="21m00Tcm4TlvDq8ikWAM"    # Rachel voice
@@ -28,15 +36,18 @@ def example_basic_usage():
     print(f"Output saved to: {result['output_audio_path']}")
 
 
-def example_multiple_languages():
+async def example_multiple_languages():
     """
     Advanced example: Translate the same audio to multiple languages
+    
+    The audio is transcribed once, then every language is translated and
+    synthesized concurrently, so the total wait is roughly that of the slowest
+    language rather than the sum of all of them.
     """
     print("\n" + "=" * 70)
     print("EXAMPLE 2: Translate to Multiple Languages")
     print("=" * 70)
     
-    translator = AudioTranslator()
     audio_file = "sample_audio.mp3"  # Replace with your audio file
     
     # Define target languages
@@ -48,17 +59,25 @@ def example_multiple_languages():
         "pt": "Portuguese"
     }
     
-    results = {}
+    # Transcribe once and reuse the text for every language
+    original_text = await translator.transcribe_audio(audio_file)
     
-    for lang_code, lang_name in languages.items():
-        print(f"\n--- Translating to {lang_name} ---")
-        
-        result = translator.audio_translate_pipeline(
-            file_path=audio_file,
+    tasks = [
+        translator.translate_and_speak(
+            original_text=original_text,
             target_lang=lang_code,
-            voice="21m00Tcm4TlvDq8ikWAM",
-            play_audio=False  # Don't auto-play each one
+            voice="21m00Tcm4TlvDq8ikWAM"
         )
+        for lang_code in languages
+    ]
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    results = {}
+    
+    for lang_name, result in zip(languages.values(), outcomes):
+        if isinstance(result, Exception):
+            print(f"{lang_name}: failed ({result})")
+            continue
         
         results[lang_name] = result
         print(f"{lang_name}: {result['translated_text']}")
@@ -66,15 +85,17 @@ def example_multiple_languages():
     return results
 
 
-def example_different_voices():
+async def example_different_voices():
     """
-    Example: Use different ElevenLabs voices
+    Example: Use different ElevenLabs voices (run concurrently)
+    
+    Every voice reads the same Spanish text, so transcription and translation
+    happen once and only speech synthesis is repeated per voice.
     """
     print("\n" + "=" * 70)
     print("EXAMPLE 3: Different Voices")
     print("=" * 70)
     
-    translator = AudioTranslator()
     audio_file = "sample_audio.mp3"  # Replace with your audio file
     
     # Different voices for different translations
@@ -85,20 +106,27 @@ def example_different_voices():
         "Josh (Male)": "TxGEqnHWrfWFTfGW9XjX"
     }
     
-    for voice_name, voice_id in voices.items():
-        print(f"\n--- Using voice: {voice_name} ---")
-        
-        result = translator.audio_translate_pipeline(
-            file_path=audio_file,
-            target_lang="es",
-            voice=voice_id,
-            play_audio=False
+    original_text = await translator.transcribe_audio(audio_file)
+    translated_text = await translator.translate_text(original_text, "es")
+    
+    tasks = [
+        translator.text_to_speech(
+            text=translated_text,
+            voice_id=voice_id,
+            output_filename=f"translated_es_{voice_id}.mp3"
         )
-        
-        print(f"Output: {result['output_audio_path']}")
+        for voice_id in voices.values()
+    ]
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    for voice_name, result in zip(voices, outcomes):
+        if isinstance(result, Exception):
+            print(f"{voice_name}: failed ({result})")
+        else:
+            print(f"{voice_name}: {result}")
 
 
-def example_error_handling():
+async def example_error_handling():
     """
     Example: Proper error handling
     """
@@ -106,10 +134,8 @@ def example_error_handling():
     print("EXAMPLE 4: Error Handling")
     print("=" * 70)
     
-    translator = AudioTranslator()
-    
     try:
-        result = translator.audio_translate_pipeline(
+        result = await translator.audio_translate_pipeline_async(
             file_path="nonexistent_file.mp3",
             target_lang="es",
             voice="21m00Tcm4TlvDq8ikWAM"
@@ -120,11 +146,24 @@ def example_error_handling():
         print(f"Pipeline error: {e}")
 
 
+async def run_examples():
+    """Run the selected examples, then release the shared translator."""
+    async with translator:
+        # Uncomment to run examples:
+        
+        # await example_basic_usage()
+        # await example_multiple_languages()
+        # await example_different_voices()
+        # await example_error_handling()
+        
+        pass
+
+
 def main():
     """
     Main function to run examples.
     
-    Uncomment the examples you want to run.
+    Uncomment the examples you want to run in run_examples().
     """
     print("\n" + "=" * 70)
     print("AUDIO TRANSLATION & RE-DUBBING - EXAMPLES")
@@ -136,12 +175,8 @@ def main():
     print("\nUncomment the examples below to run them:")
     print("=" * 70)
     
-    # Uncomment to run examples:
-    
-    # example_basic_usage()
-    # example_multiple_languages()
-    # example_different_voices()
-    # example_error_handling()
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        runner.run(run_examples())
     
     print("\n✓ Ready to use! Edit this file to run examples.")
 
@@ -5,8 +5,10 @@ This script demonstrates that the application is ready to use.
 To actually use the app, see example_usage.py or import audio_translate_pipeline.
 """
 
+import importlib.util
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def check_environment():
     """Check if all required environment variables are set."""
@@ -34,25 +36,40 @@ def check_environment():
     return True
 
 
+def _is_installed(package):
+    """Return True if package can be found on the import path."""
+    return importlib.util.find_spec(package) is not None
+
+
 def check_dependencies():
-    """Check if all required packages are installed."""
+    """
+    Check if all required packages are installed.
+    
+    Packages are located with importlib.util.find_spec() rather than
+    imported, so the check doesn't pay the SDKs' import cost. The lookups
+    run concurrently so their filesystem probes overlap; results are
+    reported in the original order.
+    """
     print("\n[Dependency Check]")
     
     packages = {
         "openai": "OpenAI API client",
         "elevenlabs": "ElevenLabs TTS client",
+        "httpx": "Shared HTTP client",
+        "h2": "HTTP/2 support for httpx",
         "deep_translator": "Translation service",
-        "pydub": "Audio processing",
         "playsound3": "Audio playback"
     }
     
     all_installed = True
     
-    for package, description in packages.items():
-        try:
-            __import__(package)
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        installed = list(executor.map(_is_installed, packages))
+    
+    for (package, description), found in zip(packages.items(), installed):
+        if found:
             print(f"✓ {package} - {description}")
-        except ImportError:
+        else:
             print(f"✗ {package} - {description} (NOT INSTALLED)")
             all_installed = False
     